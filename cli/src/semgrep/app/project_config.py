@@ -1,7 +1,7 @@
 """
 Loading and saving of the .semgrepconfig.yml file.
 """
-import re
+import os
 from pathlib import Path
 from typing import Any
 from typing import Dict
@@ -19,7 +19,8 @@ from semgrep.verbose_logging import getLogger
 
 logger = getLogger(__name__)
 
-CONFIG_FILE_PATTERN = re.compile(r"^\.semgrepconfig(\.yml|\.yaml)?$")
+# The names a project config file can have
+CONFIG_FILE_NAMES = (".semgrepconfig", ".semgrepconfig.yml", ".semgrepconfig.yaml")
 
 
 @define
@@ -50,30 +51,23 @@ class ProjectConfig:
             if not isinstance(val, str):
                 raise ValueError("tags must be a list of strings")
 
-    @staticmethod
-    def is_project_config_file(file_path: Path) -> bool:
-        return CONFIG_FILE_PATTERN.search(file_path.name) is not None
-
     @classmethod
     def _find_all_config_files(cls, src_directory: Path, cwd_path: Path) -> List[Path]:
-        conf_files = []
+        # Directories to probe: src_directory, cwd_path, and everything in
+        # between. This works on plain strings and only stats the few names
+        # a config file can have, rather than listing every directory.
+        cur_dir = os.fspath(src_directory)
+        dirs = [cur_dir]
+        for part in cwd_path.relative_to(src_directory).parts:
+            cur_dir = os.path.join(cur_dir, part)
+            dirs.append(cur_dir)
 
-        # Populate stack of directories to traverse
-        stack = {cwd_path}
-        temp_path = src_directory
-        dir_route = cwd_path.relative_to(src_directory)
-        for parent in dir_route.parents:
-            temp_path = temp_path / parent
-            stack.add(temp_path)
-
-        # Traverse stack looking for config files
-        while stack:
-            cur_path = stack.pop()
-            if not cur_path.exists():
-                continue
-            conf_files += [
-                f for f in cur_path.iterdir() if cls.is_project_config_file(f)
-            ]
+        conf_files = []
+        for dir_ in dirs:
+            for name in CONFIG_FILE_NAMES:
+                candidate = os.path.join(dir_, name)
+                if os.path.isfile(candidate):
+                    conf_files.append(Path(candidate))
         return conf_files
 
     @classmethod
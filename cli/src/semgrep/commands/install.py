@@ -29,6 +29,9 @@ from semgrep.verbose_logging import getLogger
 
 logger = getLogger(__name__)
 
+# Size of the reads used when streaming the binary to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 def determine_semgrep_pro_path() -> Path:
     core_path = SemgrepCore.path()
@@ -43,6 +46,28 @@ def determine_semgrep_pro_path() -> Path:
     return semgrep_pro_path
 
 
+def determine_platform_kind() -> str:
+    logger.debug(f"platform is {sys.platform}")
+    machine = platform.machine()
+    # TODO: cleanup and use consistent arch name like in pro-release.jsonnet
+    if sys.platform.startswith("darwin"):
+        # TODO? other arms than arm64? let's just check a prefix.
+        if machine.startswith("arm"):
+            return "osx-arm64"
+        else:
+            return "osx-x86_64"
+    elif sys.platform.startswith("linux"):
+        if machine.startswith("arm") or machine.startswith("aarch"):
+            return "linux-arm64"
+        else:
+            return "manylinux"
+    else:
+        logger.info(
+            "Running on potentially unsupported platform. Installing linux compatible binary"
+        )
+        return "manylinux"
+
+
 # This places a stamp alongside the semgrep-core-proprietary binary indicating
 # which version of Semgrep installed it. This allows us to ensure that we are
 # not running an out-of-date binary if Semgrep is later upgraded but the
@@ -55,6 +80,19 @@ def add_semgrep_pro_version_stamp() -> None:
         f.write(__VERSION__)
 
 
+# Takes the descriptor download_semgrep_pro is writing through, which saves
+# a stat and chmod by path once the download is done.
+def add_exec_permissions(fd: int) -> None:
+    # THINK: Do we need to give exec permissions to everybody? Can this be a security risk?
+    #        The binary should not have setuid or setgid rights, so letting others
+    #        execute it should not be a problem.
+    # nosemgrep: tests.precommit_dogfooding.python.lang.security.audit.insecure-file-permissions.insecure-file-permissions
+    os.fchmod(
+        fd,
+        os.fstat(fd).st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH,
+    )
+
+
 def download_semgrep_pro(
     state: SemgrepState, platform_kind: str, destination: Path
 ) -> None:
@@ -94,10 +132,21 @@ def download_semgrep_pro(
             TransferSpeedColumn(),
             TimeRemainingColumn(),
             console=console,
-        ) as progress, destination.open("wb") as f, progress.wrap_file(
-            r.raw, total=file_size, description="Downloading..."
-        ) as r_raw:
-            shutil.copyfileobj(r_raw, f)
+        ) as progress, destination.open("wb") as f:
+            task = progress.add_task("Downloading...", total=file_size)
+            # iter_content decodes gzip/deflate bodies; Content-Length is then
+            # the encoded size, so track wire bytes with tell() in that case.
+            track_encoded_size = (
+                bool(file_size)
+                and r.headers.get("Content-Encoding", "identity") != "identity"
+            )
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                if track_encoded_size:
+                    progress.update(task, completed=r.raw.tell())
+                else:
+                    progress.update(task, advance=len(chunk))
+            add_exec_permissions(f.fileno())
 
 
 def run_install_semgrep_pro(custom_binary: Optional[str] = None) -> None:
@@ -117,26 +166,7 @@ def run_install_semgrep_pro(custom_binary: Optional[str] = None) -> None:
         )
         sys.exit(INVALID_API_KEY_EXIT_CODE)
 
-    logger.debug(f"platform is {sys.platform}")
-    # TODO: cleanup and use consistent arch name like in pro-release.jsonnet
-    if sys.platform.startswith("darwin"):
-        # TODO? other arms than arm64? let's just check a prefix.
-        if platform.machine().startswith("arm"):
-            platform_kind = "osx-arm64"
-        else:
-            platform_kind = "osx-x86_64"
-    elif sys.platform.startswith("linux"):
-        if platform.machine().startswith("arm") or platform.machine().startswith(
-            "aarch"
-        ):
-            platform_kind = "linux-arm64"
-        else:
-            platform_kind = "manylinux"
-    else:
-        platform_kind = "manylinux"
-        logger.info(
-            "Running on potentially unsupported platform. Installing linux compatible binary"
-        )
+    platform_kind = determine_platform_kind()
 
     # Download the binary into a temporary location, check it, then install it.
     # This should prevent bad installations.
@@ -148,18 +178,15 @@ def run_install_semgrep_pro(custom_binary: Optional[str] = None) -> None:
     else:
         custom_binary_path = Path(custom_binary)
         shutil.copy(custom_binary_path, semgrep_pro_path_tmp)
-
-    # THINK: Do we need to give exec permissions to everybody? Can this be a security risk?
-    #        The binary should not have setuid or setgid rights, so letting others
-    #        execute it should not be a problem.
-    # nosemgrep: tests.precommit_dogfooding.python.lang.security.audit.insecure-file-permissions.insecure-file-permissions
-    os.chmod(
-        semgrep_pro_path_tmp,
-        os.stat(semgrep_pro_path_tmp).st_mode
-        | stat.S_IEXEC
-        | stat.S_IXGRP
-        | stat.S_IXOTH,
-    )
+        # Same permissions as add_exec_permissions, but we have no open fd here
+        # nosemgrep: tests.precommit_dogfooding.python.lang.security.audit.insecure-file-permissions.insecure-file-permissions
+        os.chmod(
+            semgrep_pro_path_tmp,
+            os.stat(semgrep_pro_path_tmp).st_mode
+            | stat.S_IEXEC
+            | stat.S_IXGRP
+            | stat.S_IXOTH,
+        )
 
     # Get Pro version, it serves as a simple check that the binary works
     try:
@@ -13,6 +13,10 @@ from semgrep.rule_match import RuleMatch
 
 
 def rule_match_to_CliMatch(rule_match: RuleMatch) -> out.CliMatch:
+    # This runs once per finding, so bind the lookups we repeat to locals
+    match_extra = rule_match.match.extra
+    extra_get = rule_match.extra.get
+
     extra = out.CliMatchExtra(
         message=rule_match.message,
         metadata=out.RawJson(rule_match.metadata),
@@ -20,22 +24,25 @@ def rule_match_to_CliMatch(rule_match: RuleMatch) -> out.CliMatch:
         fingerprint=rule_match.match_based_id,
         # 'lines' already contains '\n' at the end of each line
         lines="".join(rule_match.lines).rstrip(),
-        metavars=rule_match.match.extra.metavars,
+        metavars=match_extra.metavars,
         dataflow_trace=rule_match.dataflow_trace,
-        engine_kind=rule_match.match.extra.engine_kind,
-        validation_state=rule_match.match.extra.validation_state,
+        engine_kind=match_extra.engine_kind,
+        validation_state=match_extra.validation_state,
     )
 
-    if rule_match.extra.get("sca_info"):
-        extra.sca_info = rule_match.extra.get("sca_info")
-    if rule_match.extra.get("fixed_lines"):
-        extra.fixed_lines = rule_match.extra.get("fixed_lines")
+    sca_info = extra_get("sca_info")
+    if sca_info:
+        extra.sca_info = sca_info
+    fixed_lines = extra_get("fixed_lines")
+    if fixed_lines:
+        extra.fixed_lines = fixed_lines
     if rule_match.fix is not None:
         extra.fix = rule_match.fix
     if rule_match.is_ignored is not None:
         extra.is_ignored = rule_match.is_ignored
-    if rule_match.extra.get("extra_extra"):
-        extra.extra_extra = out.RawJson(rule_match.extra.get("extra_extra"))
+    extra_extra = extra_get("extra_extra")
+    if extra_extra:
+        extra.extra_extra = out.RawJson(extra_extra)
 
     return out.CliMatch(
         check_id=out.RuleId(rule_match.rule_id),
@@ -12,11 +12,7 @@ from semgrep.formatter.base import rule_match_to_CliMatch
 from semgrep.rule import Rule
 from semgrep.rule_match import RuleMatch
 
-
-# This is for converting instances of classes generated by atdpy, which
-# all have a 'to_json' method.
-def to_json(x: Any) -> Any:
-    return x.to_json()
+CLI_OUTPUT_VERSION = out.Version(__VERSION__)
 
 
 class JsonFormatter(BaseFormatter):
@@ -34,7 +30,7 @@ class JsonFormatter(BaseFormatter):
         # Note that extra is not used here! Every part of the JSON output should
         # be specified in semgrep_output_v1.atd and be part of CliOutputExtra
         output = out.CliOutput(
-            version=out.Version(__VERSION__),
+            version=CLI_OUTPUT_VERSION,
             results=[
                 rule_match_to_CliMatch(rule_match) for rule_match in sorted_findings
             ],
@@ -46,4 +42,7 @@ class JsonFormatter(BaseFormatter):
             skipped_rules=[],  # TODO: concatenate skipped_rules field from core responses
         )
         # Sort keys for predictable output. This helps with snapshot tests, etc.
-        return json.dumps(output.to_json(), sort_keys=True, default=to_json)
+        # CliOutput.to_json() already yields plain JSON values all the way
+        # down (raw dicts are wrapped in out.RawJson), so no 'default' hook
+        # is needed.
+        return json.dumps(output.to_json(), sort_keys=True)
@@ -107,7 +107,7 @@ def suppress_errors(func: Callable[..., None]) -> Callable[..., None]:
     return wrapper
 
 
-# to be mocked to a constant function in test_metrics.py
+# to be mocked to constant functions in test_metrics.py
 def mock_float(x: float) -> float:
     return x
 
@@ -116,6 +116,10 @@ def mock_int(x: int) -> int:
     return x
 
 
+def local_now() -> datetime:
+    return datetime.now().astimezone()
+
+
 @define
 class Metrics:
     """
@@ -145,7 +149,7 @@ class Metrics:
             performance=Performance(maxMemoryBytes=None),
             extension=Extension(),
             value=Misc(features=[]),
-            started_at=Datetime(datetime.now().astimezone().isoformat()),
+            started_at=Datetime(local_now().isoformat()),
             event_id=met.Uuid(str(get_frozen_id())),
             anonymous_user_id="",
             parse_rate=[],
@@ -385,7 +389,7 @@ class Metrics:
     @suppress_errors
     def add_profiling(self, profiler: ProfileManager) -> None:
         self.payload.performance.profilingTimes = [
-            (k, v) for k, v in profiler.dump_stats().items()
+            (k, mock_float(v)) for k, v in profiler.dump_stats().items()
         ]
 
     @suppress_errors
@@ -543,7 +547,7 @@ class Metrics:
             return
 
         self.gather_click_params()
-        self.payload.sent_at = Datetime(datetime.now().astimezone().isoformat())
+        self.payload.sent_at = Datetime(local_now().isoformat())
 
         from semgrep.state import get_state  # avoiding circular import
 
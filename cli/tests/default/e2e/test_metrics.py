@@ -2,17 +2,15 @@
 Tests for semgrep.metrics and associated command-line arguments.
 """
 import json
-import os
 import re
 import sys
-import time
 import uuid
+from datetime import datetime
 from pathlib import Path
 from shutil import copytree
 from typing import Iterator
 
 import dateutil.tz
-import freezegun.api
 import pytest
 from pytest import mark
 from pytest import MonkeyPatch
@@ -181,7 +179,6 @@ def _mask_digits(value: str) -> str:
 # What calls this? What's the type of the argument? Why are they not the
 # same arguments as the other test functions?
 @pytest.mark.quick
-@pytest.mark.freeze_time("2017-03-03")
 @pytest.mark.skipif(
     sys.version_info < (3, 8),
     reason="snapshotting mock call kwargs doesn't work on py3.7",
@@ -190,12 +187,10 @@ def _mask_digits(value: str) -> str:
 @pytest.mark.osemfail
 def test_metrics_payload(tmp_path, snapshot, mocker, monkeypatch, pro_flag):
     # make the formatted timestamp strings deterministic
-    mocker.patch.object(
-        freezegun.api, "tzlocal", return_value=dateutil.tz.gettz("Asia/Tokyo")
+    mocker.patch(
+        "semgrep.metrics.local_now",
+        return_value=datetime(2017, 3, 3, tzinfo=dateutil.tz.gettz("Asia/Tokyo")),
     )
-    original_tz = os.environ.get("TZ")
-    os.environ["TZ"] = "Asia/Tokyo"
-    time.tzset()
 
     # this makes event_id deterministic
     mocker.patch("semgrep.metrics.get_frozen_id", return_value=uuid.UUID("0" * 32))
@@ -240,9 +235,3 @@ def test_metrics_payload(tmp_path, snapshot, mocker, monkeypatch, pro_flag):
     snapshot.assert_match(
         json.dumps(payload, indent=2, sort_keys=True), "metrics-payload.json"
     )
-
-    if original_tz is not None:
-        os.environ["TZ"] = original_tz
-    else:
-        del os.environ["TZ"]
-    time.tzset()
@@ -0,0 +1,36 @@
+import gzip
+import io
+import stat
+
+import pytest
+import requests
+
+from semgrep import __VERSION__
+from semgrep.commands.install import download_semgrep_pro
+
+API_URL = "https://semgrep.dev"
+
+
+@pytest.mark.quick
+def test_download_semgrep_pro_gzip_encoded(tmp_path, mocker, requests_mock):
+    payload = b"\x7fELF" + b"semgrep-core-proprietary" * 4096
+    body = gzip.compress(payload)
+    requests_mock.get(
+        f"{API_URL}/api/agent/deployments/deepbinary/manylinux?version={__VERSION__}",
+        body=io.BytesIO(body),
+        headers={"Content-Encoding": "gzip", "Content-Length": str(len(body))},
+    )
+
+    state = mocker.MagicMock()
+    state.env.semgrep_url = API_URL
+    state.app_session = requests.Session()
+    destination = tmp_path / "semgrep-core-proprietary.tmp_download"
+
+    download_semgrep_pro(state, "manylinux", destination)
+
+    # The file on disk is the decoded binary, not the gzip stream
+    assert destination.read_bytes() == payload
+    mode = destination.stat().st_mode
+    assert mode & stat.S_IXUSR
+    assert mode & stat.S_IXGRP
+    assert mode & stat.S_IXOTH
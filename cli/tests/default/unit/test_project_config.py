@@ -55,6 +55,42 @@ def test_projectconfig__find_all_config_files_monorepo(git_tmp_path):
     assert service_2_dir / ".semgrepconfig" not in config_files
 
 
+@pytest.mark.quick
+def test_projectconfig__find_all_config_files_nested(git_tmp_path):
+    dir_files = ["a/b/c/main.py", "a/other/main.py"]
+    create_mock_dir(git_tmp_path, dir_files)
+    a_dir = git_tmp_path / "a"
+    c_dir = a_dir / "b" / "c"
+
+    # Config files at the root, at an intermediate level, and in the cwd
+    make_semgrepconfig_file(git_tmp_path, CONFIG_TAGS)
+    make_semgrepconfig_file(a_dir, CONFIG_TAGS_MONOREPO_1)
+    make_semgrepconfig_file(c_dir, CONFIG_TAGS_MONOREPO_2)
+    # Not on the path from the root to the cwd
+    make_semgrepconfig_file(a_dir / "other", CONFIG_TAGS)
+
+    config_files = ProjectConfig._find_all_config_files(git_tmp_path, c_dir)
+
+    assert config_files == [
+        git_tmp_path / ".semgrepconfig",
+        a_dir / ".semgrepconfig",
+        c_dir / ".semgrepconfig",
+    ]
+
+
+@pytest.mark.quick
+def test_projectconfig__find_all_config_files_yaml_extension(git_tmp_path):
+    dir_files = ["service1/main.py"]
+    create_mock_dir(git_tmp_path, dir_files)
+    service_1_dir = git_tmp_path / "service1"
+    (service_1_dir / ".semgrepconfig.yml").write_text(CONFIG_TAGS_MONOREPO_1)
+    (service_1_dir / "semgrepconfig.yml").write_text(CONFIG_TAGS_MONOREPO_2)
+
+    config_files = ProjectConfig._find_all_config_files(git_tmp_path, service_1_dir)
+
+    assert config_files == [service_1_dir / ".semgrepconfig.yml"]
+
+
 @pytest.mark.quick
 def test_projectconfig_load_all_basic(git_tmp_path, mocker):
     dir_files = ["test.py", "main.py", "setup.py"]